@@ -120,6 +120,9 @@ deploy_files() {
             log_error "Failed to copy cached images"
             return 1
         fi
+        # Cache bookkeeping files and partial downloads are not part of the site
+        rm -f "$SITE_DIR/images/"*.json
+        find "$SITE_DIR/images" -type f -name '*.part' -delete
         log_info "Copied cached images to site/images/"
     else
         log_warn "Cache directory not found, skipping image copy"
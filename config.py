@@ -6,7 +6,7 @@ used throughout the application.
 """
 
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, Optional, Tuple
 
 # Base directories
 BASE_DIR = Path(__file__).parent
@@ -18,6 +18,9 @@ SITE_DIR = BASE_DIR / "site"
 # File paths
 MANIFESTS_CACHE_FILE = LIBRARY_DIR / "manifests-cache.json"
 PARSED_PLUGINS_FILE = BASE_DIR / "parsed_plugins.json"
+ETAGS_FILE = CACHE_DIR / "etags.json"
+IMAGE_SIZES_FILE = CACHE_DIR / "image_sizes.json"
+TIMESTAMPS_FILE = CACHE_DIR / "timestamps.json"
 SEARCH_FILE = BASE_DIR / "search_file.json"
 SITE_SEARCH_FILE = SITE_DIR / "search_file.json"
 INDEX_HTML_FILE = BASE_DIR / "index.html"
@@ -30,14 +33,30 @@ VCV_LIBRARY_REPO_URL = "https://github.com/VCVRack/library.git"
 PIXELS_PER_HP = 15  # 15 pixels = 1HP
 IMAGE_BASE_URL = "https://library.vcvrack.com/screenshots/100"
 IMAGE_FORMAT = "webp"
+IMAGE_SCAN_WORKERS = 8  # threads reading cached image headers
 
 # Network configuration
 REQUEST_TIMEOUT = 10  # seconds
-DOWNLOAD_DELAY = 0.1  # seconds between downloads
+USER_AGENT = "thegrid (+https://victorkashirin.github.io/thegrid/)"
+DOWNLOAD_WORKERS = 32  # concurrent image downloads sharing one connection pool
+DOWNLOAD_MAX_RETRIES = 3
+DOWNLOAD_BACKOFF_FACTOR = 0.2  # seconds, doubled on every retry
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes read from the response stream at once
+DOWNLOAD_BUFFER_SIZE = 2 * 1024 * 1024  # write buffer, so most images take a single write
+
+# JSON files
+JSON_MMAP_MIN_BYTES = 4 * 1024 * 1024  # files this large are memory-mapped for orjson instead of read
+
+# Manifest parsing
+MANIFEST_PARSE_WORKERS: Optional[int] = None  # worker processes, None for one per CPU core
+MANIFEST_PARSE_CHUNKSIZE = 32  # manifests handed to a worker process at once
+MANIFEST_HEADER_BYTES = 4096  # bytes scanned for version/slug before a full parse
+MANIFEST_CACHE_STREAM_BYTES = 1024 * 1024  # manifest caches this large are streamed when ijson is installed
 
 # Module filtering
 MINIMUM_VERSION = "2.0.0"
-EXCLUDED_PLUGINS: List[str] = ["KRTPluginA"]
+MINIMUM_VERSION_TUPLE: Tuple[int, ...] = tuple(int(part) for part in MINIMUM_VERSION.split("."))
+EXCLUDED_PLUGINS: FrozenSet[str] = frozenset({"KRTPluginA"})
 
 # Cache configuration
 CACHE_EXPIRY_DAYS = 2  # Only re-download images if plugin was updated within this period
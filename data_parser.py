@@ -5,11 +5,27 @@ This module handles JSON parsing and filtering of VCV Rack plugin manifests.
 """
 
 import json
+import multiprocessing
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 
-from config import MINIMUM_VERSION, EXCLUDED_PLUGINS
-from logger import get_logger, log_error, log_progress
+from config import (
+    MINIMUM_VERSION_TUPLE,
+    EXCLUDED_PLUGINS,
+    MANIFEST_PARSE_WORKERS,
+    MANIFEST_PARSE_CHUNKSIZE,
+    MANIFEST_HEADER_BYTES
+)
+from logger import get_logger, log_error, use_direct_handlers, ProgressLogger
+from file_utils import json_loads, iter_files_with_suffix
+
+# Leading members of the top-level manifest object whose values are plain strings,
+# matched in the raw bytes ahead of a full parse
+_OBJECT_START_PATTERN = re.compile(rb'\s*\{')
+_STRING_MEMBER_PATTERN = re.compile(rb'\s*"([^"\\]*)"\s*:\s*"([^"\\]*)"\s*,?')
 
 
 class PluginDataParser:
@@ -17,10 +33,15 @@ class PluginDataParser:
     
     def __init__(self):
         self.logger = get_logger()
+        # Identical tag lists are shared between modules
+        self._tag_lists: Dict[Tuple[str, ...], List[str]] = {}
     
-    def parse_plugin_manifest(self, manifest_path: Path) -> List[Dict[str, Any]]:
+    def parse_plugin_manifest(self, manifest_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """
         Parse a plugin manifest file and extract module information.
+
+        Plugins that are excluded or too old are usually recognized from the
+        first MANIFEST_HEADER_BYTES of the file and rejected without decoding it.
         
         Args:
             manifest_path: Path to the plugin manifest JSON file
@@ -32,8 +53,11 @@ class PluginDataParser:
             DataParsingError: If JSON is invalid or required fields are missing
         """
         try:
-            with open(manifest_path, "r") as f:
-                data = json.load(f)
+            with open(manifest_path, "rb") as f:
+                header = f.read(MANIFEST_HEADER_BYTES)
+                if self._is_rejected_by_header(header):
+                    return []
+                data = json_loads(header + f.read())
         except json.JSONDecodeError as e:
             log_error(f"Error decoding JSON from {manifest_path}", e, self.logger)
             return []
@@ -42,7 +66,43 @@ class PluginDataParser:
             return []
         
         return self._extract_module_data(data)
-    
+
+    def _is_rejected_by_header(self, header: bytes) -> bool:
+        """
+        Check whether the start of a manifest already shows the plugin is filtered out.
+
+        Only the leading members of the top-level object are read, up to the
+        first one whose value isn't a plain string. Those are certainly
+        top-level, unlike a "slug" or "version" found anywhere in the bytes.
+        Anything not rejected here is still checked by _extract_module_data
+        after the full parse.
+
+        Args:
+            header: First bytes of the manifest file
+
+        Returns:
+            True if the plugin is certainly excluded or below the minimum version
+        """
+        match = _OBJECT_START_PATTERN.match(header)
+        if not match:
+            return False
+
+        members = {}
+        pos = match.end()
+        while True:
+            match = _STRING_MEMBER_PATTERN.match(header, pos)
+            if not match:
+                break
+            members[match.group(1)] = match.group(2)
+            pos = match.end()
+
+        slug = members.get(b"slug")
+        if slug is not None and slug.decode("utf-8", "replace") in EXCLUDED_PLUGINS:
+            return True
+
+        version = members.get(b"version")
+        return version is not None and _is_below_minimum_version(version.decode("utf-8", "replace"))
+
     def _extract_module_data(self, plugin_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract and filter module data from plugin manifest.
@@ -54,8 +114,7 @@ class PluginDataParser:
             List of filtered module dictionaries
         """
         # Check plugin version
-        version = plugin_data.get("version")
-        if version < MINIMUM_VERSION:
+        if _is_below_minimum_version(plugin_data.get("version")):
             return []
         
         # Check if plugin is excluded
@@ -82,7 +141,7 @@ class PluginDataParser:
         Returns:
             True if module should be included, False otherwise
         """
-        return not (module.get("hidden") or module.get("deprecated"))
+        return not (module.get("hidden") is True or module.get("deprecated") is True)
     
     def _create_module_info(self, plugin_name: str, plugin_slug: str, module: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -96,18 +155,55 @@ class PluginDataParser:
         Returns:
             Standardized module information dictionary
         """
+        get = module.get
         return {
             "plugin_name": plugin_name,
             "plugin_slug": plugin_slug,
-            "module_name": module.get("name"),
-            "module_slug": module.get("slug"),
-            "description": module.get("description"),
-            "tags": module.get("tags", []),
+            "module_name": get("name"),
+            "module_slug": get("slug"),
+            "description": get("description"),
+            "tags": get("tags") or [],
         }
+
+    def _share_strings(self, module: Dict[str, Any]) -> None:
+        """
+        Intern the plugin strings every module repeats and share identical tag lists.
+
+        Runs in the main process, as strings unpickled from worker results
+        are neither interned nor shared between results.
+
+        Args:
+            module: Module dictionary, updated in place
+        """
+        module["plugin_slug"] = _intern(module["plugin_slug"])
+        module["plugin_name"] = _intern(module["plugin_name"])
+        module["tags"] = self._shared_tags(module["tags"])
+
+    def _shared_tags(self, tags: List[str]) -> List[str]:
+        """
+        Return a shared, interned copy of a module's tag list.
+
+        Modules mostly use a few common tag combinations, so identical
+        lists are stored once.
+
+        Args:
+            tags: Tag list from the module manifest
+
+        Returns:
+            Tag list equal to the given one
+        """
+        key = tuple(tags)
+        shared = self._tag_lists.get(key)
+        if shared is None:
+            shared = [_intern(tag) for tag in key]
+            self._tag_lists[key] = shared
+        return shared
     
     def parse_all_manifests(self, manifests_dir: Path) -> List[Dict[str, Any]]:
         """
         Parse all plugin manifests in the specified directory.
+
+        Manifests are independent, so they are parsed in a pool of worker processes.
         
         Args:
             manifests_dir: Directory containing plugin manifest files
@@ -116,14 +212,107 @@ class PluginDataParser:
             List of all valid modules from all plugins
         """
         all_modules = []
-        json_files = list(manifests_dir.rglob("*.json"))
-        
-        for i, manifest_path in enumerate(json_files):
-            modules = self.parse_plugin_manifest(manifest_path)
-            all_modules.extend(modules)
-            
-            # Log progress every 50 files
-            if i % 50 == 0:
-                log_progress(i + 1, len(json_files), "Parsing manifests", self.logger)
+        json_files = iter_files_with_suffix(str(manifests_dir), ".json")
+        parsed_count = 0
+
+        progress = ProgressLogger("Parsed manifests", logger=self.logger)
+
+        # Bind lookups used in the loop once
+        extend_modules = all_modules.extend
+        share_strings = self._share_strings
+        update_progress = progress.update
         
-        return all_modules
\ No newline at end of file
+        # Start workers from a clean process rather than forking this one, whose
+        # logging listener thread may hold locks the children would inherit
+        with ProcessPoolExecutor(
+            max_workers=MANIFEST_PARSE_WORKERS,
+            mp_context=_worker_context(),
+            initializer=use_direct_handlers
+        ) as executor:
+            results = executor.map(_parse_one, json_files, chunksize=MANIFEST_PARSE_CHUNKSIZE)
+
+            for parsed_count, modules in enumerate(results, start=1):
+                for module in modules:
+                    share_strings(module)
+                extend_modules(modules)
+                update_progress()
+
+        self.logger.info(f"Parsed {parsed_count} manifests with {len(all_modules)} modules")
+        return all_modules
+
+
+def _parse_version(version: Any) -> Optional[Tuple[int, ...]]:
+    """
+    Convert a "major.minor.patch" version string into a comparable tuple.
+
+    Comparing strings would put "10.0.0" before "2.0.0". A leading "v" and
+    suffixes such as "-beta" are ignored, and missing components count as zero.
+
+    Args:
+        version: Plugin version string
+
+    Returns:
+        Tuple of (major, minor, patch), or None if the version is missing or
+        doesn't start with a number
+    """
+    if not isinstance(version, str):
+        return None
+    if version[:1] in ("v", "V"):
+        version = version[1:]
+
+    numbers = []
+    for part in version.split(".")[:3]:
+        match = re.match(r"\d+", part)
+        if not match:
+            break
+        numbers.append(int(match.group()))
+    if not numbers:
+        return None
+    numbers.extend([0] * (3 - len(numbers)))
+    return tuple(numbers)
+
+
+def _is_below_minimum_version(version: Any) -> bool:
+    """
+    Check whether a plugin version is older than MINIMUM_VERSION.
+
+    Versions that can't be parsed are not rejected.
+
+    Args:
+        version: Plugin version string
+
+    Returns:
+        True if the version is known to be below the minimum
+    """
+    parsed = _parse_version(version)
+    return parsed is not None and parsed < MINIMUM_VERSION_TUPLE
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated values share one object; other values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """
+    Get a multiprocessing context that doesn't fork the calling process.
+
+    Returns:
+        The "forkserver" context where available, "spawn" otherwise
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _parse_one(manifest_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse a single plugin manifest inside a worker process.
+
+    Args:
+        manifest_path: Path to the plugin manifest JSON file
+
+    Returns:
+        List of module dictionaries from the manifest
+    """
+    return PluginDataParser().parse_plugin_manifest(manifest_path)
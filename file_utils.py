@@ -4,14 +4,102 @@ File utilities module for VCV Rack Module Search.
 This module provides common file operations and JSON handling utilities.
 """
 
+import functools
 import json
+import mmap
+import os
+import shutil
+import stat
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import JSON_MMAP_MIN_BYTES
 from logger import get_logger, log_error
 from exceptions import FileProcessingError
 
 
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON from raw bytes, using orjson when it is installed.
+
+    Both parsers raise a json.JSONDecodeError subclass on invalid input.
+
+    Args:
+        data: UTF-8 encoded JSON document
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _mmap_json_loads(path: str) -> Any:
+    """
+    Parse a JSON file with orjson straight from a read-only memory map.
+
+    Saves copying the whole file into a bytes object first.
+
+    Args:
+        path: Path to a non-empty JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        # Release the view before the map is closed
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, using orjson when it is installed.
+
+    Args:
+        data: Data to serialize
+        indent: JSON indentation level (None for compact); orjson always indents by 2
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    # Match orjson's compact output, without spaces after separators
+    separators = (",", ":") if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators).encode("utf-8")
+
+
+def iter_files_with_suffix(root: str, suffix: str) -> Iterator[str]:
+    """
+    Recursively yield paths of files below a directory whose name ends with a suffix.
+
+    Walks the tree with os.scandir and yields plain strings, which is much
+    cheaper than Path.rglob for large trees. Symlinked directories are not followed.
+
+    Args:
+        root: Directory to search
+        suffix: File name suffix to match, e.g. ".json"
+
+    Yields:
+        Paths of matching files
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
+
+
 class FileUtils:
     """Utility class for common file operations."""
 
@@ -22,6 +110,10 @@ class FileUtils:
         """
         Load JSON data from a file.
 
+        Parsed data is memoized per file version (path, mtime and size), so
+        repeated loads of an unchanged file return the same object without
+        re-parsing it. Callers must copy the result before modifying it.
+
         Args:
             file_path: Path to the JSON file
 
@@ -32,8 +124,8 @@ class FileUtils:
             FileProcessingError: If file cannot be read or parsed
         """
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+            file_stat = file_path.stat()
+            return self._load_json_cached(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
         except FileNotFoundError as e:
             log_error(f"File not found: {file_path}", e, self.logger)
             raise FileProcessingError(f"File not found: {file_path}")
@@ -41,6 +133,26 @@ class FileUtils:
             log_error(f"Error decoding JSON from {file_path}", e, self.logger)
             raise FileProcessingError(f"Error decoding JSON from {file_path}")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+        """
+        Parse a JSON file; the modification time and size serve as cache key.
+
+        Files of at least JSON_MMAP_MIN_BYTES are memory-mapped when orjson is installed.
+
+        Args:
+            path: Path to the JSON file
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+
+        Returns:
+            Parsed JSON data
+        """
+        if orjson is not None and size >= JSON_MMAP_MIN_BYTES:
+            return _mmap_json_loads(path)
+        return json_loads(Path(path).read_bytes())
+
     def save_json(self, data: Any, file_path: Path, indent: int = None) -> None:
         """
         Save data to a JSON file.
@@ -54,8 +166,8 @@ class FileUtils:
             FileProcessingError: If file cannot be written
         """
         try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=indent)
+            with open(file_path, "wb") as f:
+                f.write(json_dumps(data, indent))
             self.logger.debug(f"Saved JSON data to {file_path}")
         except IOError as e:
             log_error(f"Error writing JSON to {file_path}", e, self.logger)
@@ -86,8 +198,6 @@ class FileUtils:
         Raises:
             FileProcessingError: If file cannot be copied
         """
-        import shutil
-
         try:
             # Ensure destination directory exists
             self.ensure_directory_exists(destination.parent)
@@ -108,7 +218,39 @@ class FileUtils:
         Returns:
             True if file exists, False otherwise
         """
-        return file_path.exists() and file_path.is_file()
+        file_stat = self.stat_or_none(file_path)
+        return file_stat is not None and stat.S_ISREG(file_stat.st_mode)
+
+    def stat_or_none(self, file_path: Path) -> Optional[os.stat_result]:
+        """
+        Stat a path with a single system call.
+
+        Args:
+            file_path: Path to check
+
+        Returns:
+            Stat result, or None if the path does not exist or cannot be accessed
+        """
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+
+    def list_file_names(self, directory: Path) -> Set[str]:
+        """
+        List the names of regular files directly inside a directory.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Set of file names, empty if the directory does not exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file(follow_symlinks=False)}
+        except FileNotFoundError:
+            return set()
 
     def get_file_size(self, file_path: Path) -> int:
         """
@@ -141,6 +283,9 @@ class FileUtils:
             List of matching file paths
         """
         try:
+            # Plain "*.ext" patterns don't need the glob machinery
+            if pattern.startswith("*.") and not any(c in pattern[1:] for c in "*?["):
+                return [Path(path) for path in iter_files_with_suffix(str(directory), pattern[1:])]
             return list(directory.rglob(pattern))
         except OSError as e:
             log_error(f"Error listing files in {directory} with pattern {pattern}", e, self.logger)
@@ -5,28 +5,83 @@ This module creates the optimized search data structure for the web interface.
 """
 
 import math
-from typing import List, Dict, Any
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 
 from config import (
     PARSED_PLUGINS_FILE,
     SEARCH_FILE,
     CACHE_DIR,
+    IMAGE_SIZES_FILE,
     PIXELS_PER_HP,
+    IMAGE_SCAN_WORKERS,
     SEARCH_HEADERS
 )
-from logger import get_logger, log_operation_start, log_operation_complete, log_error
+from logger import get_logger, log_operation_start, log_operation_complete, log_error, log_warning, start_queue_logging, ProgressLogger
+from exceptions import FileProcessingError
 from timestamp_manager import TimestampManager
 from file_utils import FileUtils
 
 
+def _webp_width(image_path: Path) -> Optional[int]:
+    """
+    Read the pixel width of a WebP image from its header without decoding it.
+
+    Args:
+        image_path: Path to the WebP file
+
+    Returns:
+        Image width in pixels, or None if the header is not recognized
+    """
+    with open(image_path, "rb") as f:
+        header = f.read(30)
+
+    if len(header) < 30 or header[:4] != b"RIFF" or header[8:12] != b"WEBP":
+        return None
+
+    chunk_type = header[12:16]
+    if chunk_type == b"VP8 " and header[23:26] == b"\x9d\x01\x2a":
+        # Lossy: 14-bit width follows the key frame start code
+        return int.from_bytes(header[26:28], "little") & 0x3FFF
+    if chunk_type == b"VP8L" and header[20] == 0x2F:
+        # Lossless: 14-bit width minus one follows the signature byte
+        return (int.from_bytes(header[21:23], "little") & 0x3FFF) + 1
+    if chunk_type == b"VP8X":
+        # Extended: 24-bit canvas width minus one
+        return int.from_bytes(header[24:27], "little") + 1
+    return None
+
+
+def _pil_width(image_path: Path) -> int:
+    """
+    Read the pixel width of an image with PIL, for headers _webp_width doesn't recognize.
+
+    Image.open is lazy and only parses the header; pixel data is never loaded.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Image width in pixels
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        return img.size[0]
+
+
 class SearchFileGenerator:
     """Generates optimized search data file for the web interface."""
 
     def __init__(self):
         self.logger = get_logger()
-        self.timestamp_manager = TimestampManager()
+        # Load timestamps in the background while the module data is parsed
+        self.timestamp_manager = TimestampManager(prefetch=True)
         self.file_utils = FileUtils()
+        self.cached_image_sizes = self._load_image_sizes()
+        self.image_sizes: Dict[str, Dict[str, int]] = {}
 
     def generate_search_file(self) -> None:
         """Generate optimized search data file."""
@@ -36,18 +91,23 @@ class SearchFileGenerator:
         modules = self._load_module_data()
 
         # Get module timestamps
-        module_timestamps = self.timestamp_manager.get_module_timestamps()
-
-        # Process modules with timestamps and sizes
-        processed_modules = self._process_modules(modules, module_timestamps)
+        module_timestamps = self.timestamp_manager.get_flat_module_timestamps()
 
-        # Convert to optimized array format
-        search_data = self._create_search_data(processed_modules)
+        # Build search rows with timestamps and sizes
+        rows = self._build_rows(modules, module_timestamps)
 
         # Save search file
+        search_data = {
+            "headers": SEARCH_HEADERS,
+            "data": rows
+        }
         self.file_utils.save_json(search_data, SEARCH_FILE)
 
-        log_operation_complete(f"Generated search file with {len(processed_modules)} modules", self.logger)
+        # Save image sizes for the next run
+        self.file_utils.ensure_directory_exists(IMAGE_SIZES_FILE.parent)
+        self.file_utils.save_json(self.image_sizes, IMAGE_SIZES_FILE)
+
+        log_operation_complete(f"Generated search file with {len(rows)} modules", self.logger)
 
     def _load_module_data(self) -> List[Dict[str, Any]]:
         """
@@ -61,48 +121,84 @@ class SearchFileGenerator:
         """
         return self.file_utils.load_json(PARSED_PLUGINS_FILE)
 
-    def _process_modules(self, modules: List[Dict[str, Any]], module_timestamps: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+    def _load_image_sizes(self) -> Dict[str, Dict[str, int]]:
         """
-        Process modules by adding timestamps and calculating sizes.
+        Load module sizes computed by a previous run.
 
-        Args:
-            modules: List of module dictionaries
-            module_timestamps: Nested dictionary of module timestamps
+        The file is only a cache, so a damaged one is ignored and rebuilt.
 
         Returns:
-            List of processed module dictionaries
+            Dictionary mapping "plugin_slug/module_slug" to the image file's
+            mtime_ns and size_bytes and the resulting size in hp
         """
-        processed_modules = []
-
-        for i, module in enumerate(modules):
-            plugin_slug = module["plugin_slug"]
-            module_slug = module["module_slug"]
-
-            # Get module timestamp
-            timestamp = self.timestamp_manager.get_module_timestamp(
-                plugin_slug, module_slug, module_timestamps
-            )
-
-            # Calculate module size
-            module_size = self._calculate_module_size(plugin_slug, module_slug)
+        if not self.file_utils.file_exists(IMAGE_SIZES_FILE):
+            return {}
+        try:
+            image_sizes = self.file_utils.load_json(IMAGE_SIZES_FILE)
+        except FileProcessingError:
+            image_sizes = None
+        if not isinstance(image_sizes, dict):
+            log_warning(f"Ignoring unreadable image size cache {IMAGE_SIZES_FILE}", self.logger)
+            return {}
+        return image_sizes
+
+    def _build_rows(self, modules: List[Dict[str, Any]], module_timestamps: Dict[Tuple[str, str], int]) -> List[List[Any]]:
+        """
+        Build search rows in SEARCH_HEADERS order, adding timestamps and sizes.
 
-            # Create processed module data
-            processed_module = module.copy()
-            processed_module["timestamp"] = timestamp
-            processed_module["size"] = module_size
+        Rows are emitted as arrays for a smaller file. Image sizes are read
+        on a thread pool so the file reads overlap.
 
-            processed_modules.append(processed_module)
+        Args:
+            modules: List of module dictionaries
+            module_timestamps: Module timestamps keyed by (plugin_slug, module_slug)
 
-            # Log progress every 100 modules
-            if i % 100 == 0:
-                self.logger.info(f"Processed {i + 1}/{len(modules)} modules")
+        Returns:
+            List of search rows
+        """
+        # One row per module, so allocate the list once
+        rows: List[List[Any]] = [None] * len(modules)
+
+        # Calculate module sizes, reporting progress as results arrive
+        progress = ProgressLogger("Measured module images", len(modules), logger=self.logger)
+        update_progress = progress.update
+        module_sizes = []
+        with ThreadPoolExecutor(max_workers=IMAGE_SCAN_WORKERS) as executor:
+            for module_size in executor.map(
+                lambda module: self._calculate_module_size(module["plugin_slug"], module["module_slug"]),
+                modules
+            ):
+                module_sizes.append(module_size)
+                update_progress()
+
+        # Look up all module timestamps in one batch
+        timestamps = self.timestamp_manager.get_many_module_timestamps(
+            list(map(itemgetter("plugin_slug", "module_slug"), modules)),
+            module_timestamps
+        )
+
+        for i, (module, module_size, timestamp) in enumerate(zip(modules, module_sizes, timestamps)):
+            rows[i] = [
+                module["plugin_slug"],
+                module["plugin_name"],
+                module["module_name"],
+                module["module_slug"],
+                module["description"],
+                module["tags"],
+                timestamp,
+                module_size
+            ]
 
-        return processed_modules
+        return rows
 
     def _calculate_module_size(self, plugin_slug: str, module_slug: str) -> int:
         """
         Calculate module size in HP from image width.
 
+        Sizes from the previous run are reused while the image file's mtime
+        and size are unchanged. Otherwise the width is read from the WebP
+        header; PIL is only used for images whose header isn't recognized.
+
         Args:
             plugin_slug: Plugin identifier
             module_slug: Module identifier
@@ -110,48 +206,35 @@ class SearchFileGenerator:
         Returns:
             Module size in HP, or None if image cannot be processed
         """
+        image_path = CACHE_DIR / plugin_slug / f"{module_slug}.webp"
+        stat = self.file_utils.stat_or_none(image_path)
+        if stat is None:
+            return None
+
+        key = f"{plugin_slug}/{module_slug}"
+        cached = self.cached_image_sizes.get(key)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size_bytes"] == stat.st_size:
+            self.image_sizes[key] = cached
+            return cached["hp"]
+
         try:
-            image_path = CACHE_DIR / plugin_slug / f"{module_slug}.webp"
-            if image_path.exists():
-                with Image.open(image_path) as img:
-                    width = img.width
-                    return math.ceil(width / PIXELS_PER_HP)
+            width = _webp_width(image_path)
+            if width is None:
+                width = _pil_width(image_path)
+            module_size = math.ceil(width / PIXELS_PER_HP)
         except Exception as e:
             log_error(f"Error processing image for {plugin_slug}/{module_slug}", e, self.logger)
+            return None
 
-        return None
-
-    def _create_search_data(self, modules: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Convert module data to optimized search format.
-
-        Args:
-            modules: List of processed module dictionaries
-
-        Returns:
-            Optimized search data structure
-        """
-        # Convert to array format for smaller file size
-        data_arrays = []
-        for module in modules:
-            data_array = [
-                module["plugin_slug"],
-                module["plugin_name"],
-                module["module_name"],
-                module["module_slug"],
-                module["description"],
-                module["tags"],
-                module["timestamp"],
-                module["size"]
-            ]
-            data_arrays.append(data_array)
-
-        return {
-            "headers": SEARCH_HEADERS,
-            "data": data_arrays
+        self.image_sizes[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size_bytes": stat.st_size,
+            "hp": module_size
         }
+        return module_size
 
 
 if __name__ == "__main__":
+    start_queue_logging()
     generator = SearchFileGenerator()
     generator.generate_search_file()
\ No newline at end of file
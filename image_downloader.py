@@ -4,29 +4,55 @@ Image downloading module for VCV Rack Module Search.
 This module handles downloading and caching of module images.
 """
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import formatdate
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import (
     CACHE_DIR,
+    ETAGS_FILE,
     IMAGE_BASE_URL,
     IMAGE_FORMAT,
     REQUEST_TIMEOUT,
-    DOWNLOAD_DELAY,
+    USER_AGENT,
+    DOWNLOAD_WORKERS,
+    DOWNLOAD_MAX_RETRIES,
+    DOWNLOAD_BACKOFF_FACTOR,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_BUFFER_SIZE,
     CACHE_EXPIRY_DAYS
 )
-from logger import get_logger, log_operation_start, log_operation_complete, log_error, log_progress
-from exceptions import NetworkError
+from logger import get_logger, log_operation_start, log_operation_complete, log_error, log_warning, ProgressLogger
+from exceptions import FileProcessingError, NetworkError
+from file_utils import FileUtils
+
+# Per-module download outcomes
+STATUS_DOWNLOADED = "downloaded"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
 
 
 class ImageDownloader:
-    """Handles downloading and caching of VCV Rack module images."""
+    """
+    Handles downloading and caching of VCV Rack module images.
+
+    Keeps an HTTP session open for its lifetime; use it as a context manager
+    or call close() when done.
+    """
 
     def __init__(self, build_timestamps: Dict[str, int]):
         self.logger = get_logger()
+        self.file_utils = FileUtils()
+        self.session = self._create_session()
         self.build_timestamps = build_timestamps
+        self.etags: Dict[str, Dict[str, str]] = {}
+        self.recently_updated_plugins: FrozenSet[str] = frozenset()
         self.downloaded_count = 0
         self.skipped_count = 0
 
@@ -34,6 +60,9 @@ class ImageDownloader:
         """
         Download images for all modules in the provided list.
 
+        Cached images of plugins that weren't updated recently are skipped
+        up front, so only the remaining modules reach the download workers.
+
         Args:
             modules: List of module dictionaries containing plugin_slug and module_slug
         """
@@ -42,129 +71,262 @@ class ImageDownloader:
         CACHE_DIR.mkdir(exist_ok=True)
         self.downloaded_count = 0
         self.skipped_count = 0
-
-        for i, module in enumerate(modules):
-            self._download_module_image(module)
-
-            # Log progress every 100 images
-            if i % 100 == 0:
-                log_progress(i + 1, len(modules), "Downloading images", self.logger)
+        self.etags = self._load_etags()
+        self.recently_updated_plugins = self._get_recently_updated_plugins()
+
+        pending_modules = self._get_pending_modules(modules)
+        self.skipped_count = len(modules) - len(pending_modules)
+
+        # Resolve and create each plugin folder, and its URL prefix, once rather than once per module
+        plugin_locations: Dict[str, Tuple[str, Path]] = {}
+        for plugin_slug in {module["plugin_slug"] for module in pending_modules}:
+            plugin_dir = CACHE_DIR / plugin_slug
+            plugin_dir.mkdir(exist_ok=True)
+            plugin_locations[plugin_slug] = (f"{IMAGE_BASE_URL}/{plugin_slug}/", plugin_dir)
+
+        progress = ProgressLogger("Downloading images", len(pending_modules), logger=self.logger)
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(self._download_module_image, module, *plugin_locations[module["plugin_slug"]])
+                for module in pending_modules
+            ]
+
+            # Tally in completion order so one slow download doesn't hold back the counters
+            for future in as_completed(futures):
+                status = future.result()
+                if status == STATUS_DOWNLOADED:
+                    self.downloaded_count += 1
+                elif status == STATUS_SKIPPED:
+                    self.skipped_count += 1
+                progress.update()
+
+        self.file_utils.save_json(self.etags, ETAGS_FILE)
 
         log_operation_complete(
             f"Image download complete: {self.downloaded_count} downloaded, {self.skipped_count} skipped",
             self.logger
         )
 
-    def _download_module_image(self, module: Dict[str, Any]) -> None:
+    def _load_etags(self) -> Dict[str, Dict[str, str]]:
         """
-        Download a single module image if needed.
+        Load the HTTP cache validators stored for previously downloaded images.
 
-        Args:
-            module: Module dictionary containing plugin_slug and module_slug
+        The validators only save bandwidth, so a damaged file is ignored and rebuilt.
+
+        Returns:
+            Dictionary mapping "plugin_slug/module_slug" to its ETag/Last-Modified values
         """
-        plugin_slug = module["plugin_slug"]
-        module_slug = module["module_slug"]
+        if not self.file_utils.file_exists(ETAGS_FILE):
+            return {}
+        try:
+            etags = self.file_utils.load_json(ETAGS_FILE)
+        except FileProcessingError:
+            etags = None
+        if not isinstance(etags, dict):
+            log_warning(f"Ignoring unreadable ETag store {ETAGS_FILE}", self.logger)
+            return {}
+        # Copy, as the loaded data is shared with the FileUtils cache
+        return dict(etags)
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session with a connection pool sized for the download workers.
 
-        image_url = f"{IMAGE_BASE_URL}/{plugin_slug}/{module_slug}.{IMAGE_FORMAT}"
-        plugin_folder = CACHE_DIR / plugin_slug
-        plugin_folder.mkdir(exist_ok=True)
-        image_path = plugin_folder / f"{module_slug}.{IMAGE_FORMAT}"
+        All images come from a single host, so its pool holds one keep-alive
+        connection per worker and workers wait for a free connection instead
+        of opening throwaway ones.
 
-        if self._should_skip_download(image_path, image_url, plugin_slug):
-            self.skipped_count += 1
-            return
+        Retries with exponential backoff replace a fixed delay between downloads,
+        so the server can still throttle us via 429/503 responses.
 
-        try:
-            self._download_image(image_url, image_path)
-            self.downloaded_count += 1
-        except NetworkError as e:
-            log_error(f"Failed to download {image_url}", e, self.logger)
+        Returns:
+            Configured requests session
+        """
+        retry = Retry(
+            total=DOWNLOAD_MAX_RETRIES,
+            backoff_factor=DOWNLOAD_BACKOFF_FACTOR,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(
+            pool_connections=DOWNLOAD_WORKERS,
+            pool_maxsize=DOWNLOAD_WORKERS,
+            pool_block=True,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "ImageDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
-    def _should_skip_download(self, image_path: Path, image_url: str, plugin_slug: str) -> bool:
+    def _download_module_image(self, module: Dict[str, Any], url_prefix: str, plugin_dir: Path) -> str:
         """
-        Determine if an image download should be skipped.
+        Download or revalidate a single module image.
+
+        Runs on a worker thread, so it reports its outcome instead of updating counters.
 
         Args:
-            image_path: Local path where image would be saved
-            image_url: URL of the remote image
-            plugin_slug: Plugin slug for timestamp checking
+            module: Module dictionary containing plugin_slug and module_slug
+            url_prefix: Image URL of the module's plugin folder, ending with a slash
+            plugin_dir: Cache folder of the module's plugin
 
         Returns:
-            True if download should be skipped, False otherwise
+            One of STATUS_DOWNLOADED, STATUS_SKIPPED or STATUS_FAILED
         """
-        if not image_path.exists():
-            return False
+        plugin_slug = module["plugin_slug"]
+        module_slug = module["module_slug"]
+
+        file_name = f"{module_slug}.{IMAGE_FORMAT}"
+        image_url = url_prefix + file_name
+        image_path = plugin_dir / file_name
 
-        # Check if plugin hasn't been updated recently
-        if self._get_days_since_update(plugin_slug) > CACHE_EXPIRY_DAYS:
-            return True
+        image_stat = self.file_utils.stat_or_none(image_path)
+        etag_key = f"{plugin_slug}/{module_slug}"
+        headers = self._get_conditional_headers(etag_key, image_stat.st_mtime) if image_stat else {}
 
-        # Compare file sizes
-        local_size = image_path.stat().st_size
-        remote_size = self._get_remote_file_size(image_url)
+        try:
+            validators = self._download_image(image_url, image_path, headers)
+        except NetworkError as e:
+            log_error(f"Failed to download {image_url}", e, self.logger)
+            return STATUS_FAILED
 
-        if remote_size != -1 and local_size == remote_size:
-            self.logger.debug(f"Skipping {image_path} - sizes match ({local_size} bytes)")
-            return True
+        if validators is None:
+            self.logger.debug(f"Skipping {image_path} - not modified")
+            return STATUS_SKIPPED
 
-        return False
+        self.etags[etag_key] = validators
+        return STATUS_DOWNLOADED
 
-    def _get_days_since_update(self, plugin_slug: str) -> int:
+    def _get_conditional_headers(self, etag_key: str, cached_mtime: float) -> Dict[str, str]:
         """
-        Get the number of days since a plugin was last updated.
+        Build conditional request headers for an already cached image.
+
+        Uses the validators stored for the image. Images cached without them
+        fall back to the local file's modification time, which is when it
+        was downloaded.
 
         Args:
-            plugin_slug: Plugin slug to check
+            etag_key: Key of the image in the ETag store
+            cached_mtime: Modification time of the cached image file
 
         Returns:
-            Number of days since last update, or a large number if unknown
+            Request headers
         """
-        from datetime import datetime
+        validators = self.etags.get(etag_key, {})
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+        if not headers:
+            headers["If-Modified-Since"] = formatdate(cached_mtime, usegmt=True)
+        return headers
+
+    def _get_recently_updated_plugins(self) -> FrozenSet[str]:
+        """
+        Find plugins built within the last CACHE_EXPIRY_DAYS days.
 
-        if plugin_slug not in self.build_timestamps:
-            return 1000000  # Very large number to indicate unknown
+        Evaluated once per run, so the per-module check is a set lookup.
 
-        timestamp = self.build_timestamps[plugin_slug]
-        return (datetime.now() - datetime.fromtimestamp(timestamp)).days
+        Returns:
+            Slugs of recently updated plugins
+        """
+        cutoff = time.time() - CACHE_EXPIRY_DAYS * 86400
+        return frozenset(
+            slug for slug, timestamp in self.build_timestamps.items()
+            if timestamp >= cutoff
+        )
 
-    def _get_remote_file_size(self, url: str) -> int:
+    def _get_pending_modules(self, modules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Get the file size of a remote file using a HEAD request.
+        Select the modules whose images must be requested from the server.
+
+        Cached images of plugins that weren't updated recently are kept as is.
+        Each such plugin folder is listed once instead of stat-ing every image.
 
         Args:
-            url: URL to check
+            modules: List of module dictionaries containing plugin_slug and module_slug
 
         Returns:
-            File size in bytes, or -1 if the request fails
+            Modules that need to be downloaded or revalidated
         """
-        try:
-            response = requests.head(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return int(response.headers.get("content-length", -1))
-        except requests.RequestException as e:
-            log_error(f"Failed to get remote file size for {url}", e, self.logger)
-            return -1
-
-    def _download_image(self, url: str, local_path: Path) -> None:
+        cached_images: Dict[str, Set[str]] = {}
+        pending_modules = []
+
+        for module in modules:
+            plugin_slug = module["plugin_slug"]
+            # Recently updated plugins are always revalidated; unknown plugins count as stale
+            if plugin_slug not in self.recently_updated_plugins:
+                if plugin_slug not in cached_images:
+                    cached_images[plugin_slug] = self.file_utils.list_file_names(CACHE_DIR / plugin_slug)
+                if f"{module['module_slug']}.{IMAGE_FORMAT}" in cached_images[plugin_slug]:
+                    continue
+            pending_modules.append(module)
+
+        return pending_modules
+
+    def _download_image(
+        self,
+        url: str,
+        local_path: Path,
+        headers: Dict[str, str]
+    ) -> Optional[Dict[str, str]]:
         """
         Download an image from a URL and save it locally.
 
+        The body is streamed into a temporary ".part" file which replaces the
+        cached image only once complete, so a failed download never leaves a
+        truncated image behind.
+
         Args:
             url: URL of the image to download
             local_path: Local path to save the image
+            headers: Conditional request headers for an already cached image
+
+        Returns:
+            ETag/Last-Modified validators of the downloaded image,
+            or None if the server reported it as not modified
 
         Raises:
             NetworkError: If the download fails
         """
+        part_path = local_path.with_name(local_path.name + ".part")
         try:
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            with open(local_path, "wb") as img_file:
-                img_file.write(response.content)
-
-            time.sleep(DOWNLOAD_DELAY)
-            self.logger.debug(f"Downloaded: {local_path}")
+            with self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+
+                if response.status_code == 304:
+                    return None
+
+                try:
+                    with open(part_path, "wb", buffering=DOWNLOAD_BUFFER_SIZE) as img_file:
+                        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                            img_file.write(chunk)
+                    os.replace(part_path, local_path)
+                except BaseException:
+                    # Never leave a partial download in the cache, even when interrupted
+                    part_path.unlink(missing_ok=True)
+                    raise
+
+                self.logger.debug(f"Downloaded: {local_path}")
+
+                validators = {}
+                if "ETag" in response.headers:
+                    validators["etag"] = response.headers["ETag"]
+                if "Last-Modified" in response.headers:
+                    validators["last_modified"] = response.headers["Last-Modified"]
+                return validators
 
         except requests.RequestException as e:
             raise NetworkError(f"Failed to download {url}: {e}")
\ No newline at end of file
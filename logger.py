@@ -5,11 +5,19 @@ This module provides structured logging with appropriate levels and formatting
 to replace print statements throughout the application.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+
+# Background listeners writing the records of each configured logger
+_queue_listeners: Dict[str, QueueListener] = {}
 
 
 def setup_logger(
@@ -20,6 +28,9 @@ def setup_logger(
 ) -> logging.Logger:
     """
     Set up a logger with both file and console handlers.
+
+    Handlers write directly; scripts move them to a background thread
+    with start_queue_logging.
     
     Args:
         name: Logger name
@@ -34,6 +45,7 @@ def setup_logger(
     logger.setLevel(level)
     
     # Clear existing handlers to avoid duplicates
+    _stop_queue_listener(name)
     logger.handlers.clear()
     
     # Create formatter
@@ -42,24 +54,82 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    handlers = []
+    
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
-    # File handler
+    # File handler, opened on the first record
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, mode="a", delay=True)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    for handler in handlers:
+        logger.addHandler(handler)
     
     return logger
 
 
+def start_queue_logging(name: str = "vcv_module_search") -> None:
+    """
+    Move a logger's handlers to a background QueueListener thread.
+
+    Logging from hot loops and worker threads then only enqueues the record
+    instead of blocking on console or file I/O. Call it from a script's entry
+    point only: worker processes must keep direct handlers, as nothing drains
+    their queue when they exit.
+
+    Args:
+        name: Logger name
+    """
+    logger = get_logger(name)
+    if name in _queue_listeners:
+        return
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
+    logger.handlers[:] = [QueueHandler(log_queue)]
+
+
+def _stop_queue_listener(name: str) -> None:
+    """Stop the queue listener of a logger, writing out any pending records."""
+    listener = _queue_listeners.pop(name, None)
+    if listener:
+        listener.stop()
+
+
+def shutdown_logging() -> None:
+    """Stop all queue listeners, writing out any pending records."""
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
+
+
+def use_direct_handlers() -> None:
+    """
+    Make every logger write through its own handlers, without a queue listener.
+
+    Serves as the initializer of worker processes and runs after a fork,
+    where the listener thread doesn't exist.
+    """
+    for name, listener in _queue_listeners.items():
+        logging.getLogger(name).handlers[:] = listener.handlers
+    _queue_listeners.clear()
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=use_direct_handlers)
+
+
 def get_logger(name: str = "vcv_module_search") -> logging.Logger:
     """
     Get an existing logger or create a new one with default settings.
@@ -132,4 +202,45 @@ def log_progress(current: int, total: int, operation: str, logger: Optional[logg
     if logger is None:
         logger = default_logger
     percentage = (current / total) * 100 if total > 0 else 0
-    logger.info(f"{operation}: {current}/{total} ({percentage:.1f}%)")
\ No newline at end of file
+    logger.info(f"{operation}: {current}/{total} ({percentage:.1f}%)")
+
+
+class ProgressLogger:
+    """
+    Log progress of a long-running operation at most once per time interval.
+
+    Unlike logging every N items, the overhead doesn't grow with the number
+    of items, and fast and slow loops log at the same rate.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        total: Optional[int] = None,
+        interval: float = 2.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            operation: Description used in progress messages
+            total: Expected number of items, if known
+            interval: Minimum number of seconds between progress messages
+            logger: Logger to write to
+        """
+        self.operation = operation
+        self.total = total
+        self.interval = interval
+        self.logger = logger if logger is not None else default_logger
+        self.count = 0
+        self._next_log_time = time.monotonic() + interval
+
+    def update(self, count: int = 1) -> None:
+        """Record processed items, logging progress if the interval has elapsed."""
+        self.count += count
+        now = time.monotonic()
+        if now >= self._next_log_time:
+            self._next_log_time = now + self.interval
+            if self.total is not None:
+                log_progress(self.count, self.total, self.operation, self.logger)
+            else:
+                self.logger.info(f"{self.operation}: {self.count}")
\ No newline at end of file
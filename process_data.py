@@ -10,7 +10,7 @@ from config import (
     MANIFESTS_DIR,
     PARSED_PLUGINS_FILE
 )
-from logger import get_logger, log_operation_start, log_operation_complete
+from logger import get_logger, log_operation_start, log_operation_complete, start_queue_logging
 from data_parser import PluginDataParser
 from image_downloader import ImageDownloader
 from timestamp_manager import TimestampManager
@@ -39,7 +39,7 @@ class ModuleDataProcessor:
         all_modules = self.data_parser.parse_all_manifests(MANIFESTS_DIR)
 
         # Save parsed data
-        self.file_utils.save_json(all_modules, PARSED_PLUGINS_FILE, indent=4)
+        self.file_utils.save_json(all_modules, PARSED_PLUGINS_FILE)
         self.logger.info(f"Saved {len(all_modules)} modules to {PARSED_PLUGINS_FILE}")
 
         # Download images
@@ -56,10 +56,11 @@ class ModuleDataProcessor:
             modules: List of module dictionaries
         """
         build_timestamps = self.timestamp_manager.get_build_timestamps()
-        image_downloader = ImageDownloader(build_timestamps)
-        image_downloader.download_module_images(modules)
+        with ImageDownloader(build_timestamps) as image_downloader:
+            image_downloader.download_module_images(modules)
 
 
 if __name__ == "__main__":
+    start_queue_logging()
     processor = ModuleDataProcessor()
     processor.process_plugins()
\ No newline at end of file
@@ -5,13 +5,18 @@ This module analyzes tag usage across all modules and provides statistics
 for understanding tag distribution and popularity.
 """
 
-import json
 from collections import Counter
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Tuple
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from config import PARSED_PLUGINS_FILE
-from logger import get_logger, log_operation_start, log_operation_complete
+from logger import get_logger, log_error, log_operation_start, log_operation_complete
+from exceptions import FileProcessingError
 from file_utils import FileUtils
 
 
@@ -26,19 +31,16 @@ class TagStatsAnalyzer:
         """
         Analyze and display tag usage statistics.
         
-        Loads module data, extracts all tags, counts occurrences,
+        Loads module data, counts tag occurrences,
         and displays results sorted by popularity.
         """
         log_operation_start("Analyzing tag statistics", self.logger)
         
-        # Load module data
-        modules = self._load_module_data()
-        
-        # Extract all tags
-        all_tags = self._extract_all_tags(modules)
+        # Count tags
+        tag_counter = self._count_tags()
         
-        # Count and display tag statistics
-        self._display_tag_statistics(all_tags)
+        # Display tag statistics
+        self._display_tag_statistics(tag_counter)
         
         log_operation_complete("Tag statistics analysis", self.logger)
 
@@ -54,32 +56,75 @@ class TagStatsAnalyzer:
         """
         return self.file_utils.load_json(PARSED_PLUGINS_FILE)
 
-    def _extract_all_tags(self, modules: List[Dict[str, Any]]) -> List[str]:
+    def _count_tags(self) -> Counter:
+        """
+        Count tag occurrences in the parsed plugins file.
+
+        Tags are streamed straight from disk when ijson is available, so no
+        module dictionaries are built; otherwise the whole file is loaded.
+
+        Returns:
+            Counter mapping tag names to occurrence counts
+
+        Raises:
+            FileProcessingError: If file cannot be loaded
+        """
+        if ijson is None:
+            return self._compute_tag_counter(self._load_module_data())
+
+        try:
+            tag_counter = Counter(self._tag_stream(PARSED_PLUGINS_FILE))
+        except FileNotFoundError as e:
+            log_error(f"File not found: {PARSED_PLUGINS_FILE}", e, self.logger)
+            raise FileProcessingError(f"File not found: {PARSED_PLUGINS_FILE}")
+        except ijson.JSONError as e:
+            log_error(f"Error decoding JSON from {PARSED_PLUGINS_FILE}", e, self.logger)
+            raise FileProcessingError(f"Error decoding JSON from {PARSED_PLUGINS_FILE}")
+
+        self.logger.info(f"Counted {sum(tag_counter.values())} total tags from {PARSED_PLUGINS_FILE.name}")
+        return tag_counter
+
+    @staticmethod
+    def _tag_stream(file_path: Path) -> Iterator[str]:
+        """
+        Stream every module tag from a parsed plugins file.
+
+        Args:
+            file_path: Path to the parsed plugins JSON file
+
+        Yields:
+            Tag names in file order
+        """
+        with open(file_path, "rb") as f:
+            yield from ijson.items(f, "item.tags.item")
+
+    def _compute_tag_counter(self, modules: List[Dict[str, Any]]) -> Counter:
         """
-        Extract all tags from module data.
+        Count tag occurrences across all modules in a single pass.
         
         Args:
             modules: List of module dictionaries
             
         Returns:
-            List of all tags found across all modules
+            Counter mapping tag names to occurrence counts
         """
-        all_tags = []
+        tag_counter = Counter()
+        update = tag_counter.update
         for module in modules:
-            if 'tags' in module and module['tags']:
-                all_tags.extend(module['tags'])
+            tags = module.get('tags')
+            if tags:
+                update(tags)
         
-        self.logger.info(f"Extracted {len(all_tags)} total tags from {len(modules)} modules")
-        return all_tags
+        self.logger.info(f"Counted {sum(tag_counter.values())} total tags from {len(modules)} modules")
+        return tag_counter
 
-    def _display_tag_statistics(self, all_tags: List[str]) -> None:
+    def _display_tag_statistics(self, tag_counter: Counter) -> None:
         """
-        Count tag occurrences and display statistics.
+        Display tag statistics sorted by popularity.
         
         Args:
-            all_tags: List of all tags to analyze
+            tag_counter: Counter of tag occurrences
         """
-        tag_counter = Counter(all_tags)
         unique_tags = len(tag_counter)
         
         self.logger.info(f"Found {unique_tags} unique tags")
@@ -98,9 +143,7 @@ class TagStatsAnalyzer:
         Returns:
             Dictionary mapping tag names to occurrence counts
         """
-        modules = self._load_module_data()
-        all_tags = self._extract_all_tags(modules)
-        tag_counter = Counter(all_tags)
+        tag_counter = self._count_tags()
         
         return dict(tag_counter)
 
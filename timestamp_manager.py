@@ -4,91 +4,248 @@ Timestamp management module for VCV Rack Module Search.
 This module handles reading and processing build timestamps from manifest cache.
 """
 
-import json
-from typing import Dict
-
-from config import MANIFESTS_CACHE_FILE
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import repeat
+from operator import itemgetter, methodcaller
+from sys import intern
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from config import CACHE_DIR, MANIFESTS_CACHE_FILE, MANIFEST_CACHE_STREAM_BYTES, TIMESTAMPS_FILE
 from logger import get_logger, log_error
 from exceptions import FileProcessingError
+from file_utils import FileUtils
+
+# (plugin slug, plugin data) pairs of the manifest cache, loaded or streamed
+PluginItems = Iterable[Tuple[str, Dict[str, Any]]]
+
+_get_creation_timestamp = itemgetter("creationTimestamp")
+_get_creation_timestamp_or_none = methodcaller("get", "creationTimestamp")
+
+
+def _module_timestamp_items(
+    plugin_slug: str,
+    modules: Dict[str, Dict[str, Any]],
+    get_timestamp: Callable[[Dict[str, Any]], Optional[int]]
+) -> Iterator[Tuple[Tuple[str, str], Optional[int]]]:
+    """
+    Pair each of a plugin's modules with its creation timestamp, without a Python-level loop.
+
+    Args:
+        plugin_slug: Interned plugin slug
+        modules: Module slugs mapped to module manifest data
+        get_timestamp: Getter reading the creation timestamp from module data
+
+    Returns:
+        Iterator of ((plugin slug, interned module slug), timestamp) pairs
+    """
+    return zip(zip(repeat(plugin_slug), map(intern, modules)), map(get_timestamp, modules.values()))
+
+
+# Tells missing modules apart from modules whose timestamp is None
+_MISSING = object()
 
 
 class TimestampManager:
     """Handles reading and processing build timestamps from VCV library manifest cache."""
 
-    def __init__(self):
+    def __init__(self, prefetch: bool = False):
         self.logger = get_logger()
+        self.file_utils = FileUtils()
+        self._prefetch: Optional[Future] = None
 
-    def get_build_timestamps(self) -> Dict[str, int]:
+        # Optionally start loading right away on a background thread; not for
+        # processes that fork worker processes afterwards
+        if prefetch:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._prefetch = executor.submit(self._load_all_timestamps)
+            executor.shutdown(wait=False)
+
+    def get_all_timestamps(self) -> Tuple[Dict[str, int], Dict[Tuple[str, str], int]]:
         """
-        Load build timestamps from the manifest cache file.
+        Load build and module creation timestamps in a single pass over the manifest cache.
+
+        Both projections are persisted to TIMESTAMPS_FILE together with the
+        manifest cache's modification time and size, so later runs skip the
+        manifest entirely while it is unchanged.
 
         Returns:
-            Dictionary mapping plugin slugs to their build timestamps
+            Tuple of (plugin slug -> build timestamp,
+            (plugin slug, module slug) -> creation timestamp)
 
         Raises:
             FileProcessingError: If cache file cannot be read or parsed
         """
-        try:
-            with open(MANIFESTS_CACHE_FILE, "r") as f:
-                manifest_cache = json.load(f)
+        # A prefetch started in __init__ answers the first call, errors included
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            return prefetch.result()
+        return self._load_all_timestamps()
 
-            return {
-                slug: data.get("buildTimestamp", -1)
-                for slug, data in manifest_cache.items()
-            }
+    def get_build_timestamps(self) -> Dict[str, int]:
+        """
+        Load build timestamps from the manifest cache file.
 
-        except FileNotFoundError as e:
-            log_error(f"Manifest cache file not found: {MANIFESTS_CACHE_FILE}", e, self.logger)
-            return {}
-        except json.JSONDecodeError as e:
-            log_error(f"Error decoding manifest cache file: {MANIFESTS_CACHE_FILE}", e, self.logger)
+        Returns:
+            Dictionary mapping plugin slugs to their build timestamps,
+            or an empty dictionary if the cache file cannot be read or parsed
+        """
+        try:
+            return self.get_all_timestamps()[0]
+        except FileProcessingError:
             return {}
 
-    def get_module_timestamps(self) -> Dict[str, Dict[str, int]]:
+    def get_flat_module_timestamps(self) -> Dict[Tuple[str, str], int]:
         """
-        Load module creation timestamps from the manifest cache file.
+        Load module creation timestamps keyed by (plugin_slug, module_slug).
+
+        A single hash lookup per module instead of a nested traversal.
 
         Returns:
-            Nested dictionary mapping plugin slugs to module slugs to creation timestamps
+            Dictionary mapping (plugin slug, module slug) pairs to creation timestamps
 
         Raises:
             FileProcessingError: If cache file cannot be read or parsed
         """
-        try:
-            with open(MANIFESTS_CACHE_FILE, "r") as f:
-                manifest_cache = json.load(f)
-
-            module_timestamps = {}
-            for plugin_slug, plugin_data in manifest_cache.items():
-                modules = plugin_data.get("modules", {})
-                module_timestamps[plugin_slug] = {
-                    module_slug: module_data.get("creationTimestamp")
-                    for module_slug, module_data in modules.items()
+        return self.get_all_timestamps()[1]
+
+    def _load_all_timestamps(self) -> Tuple[Dict[str, int], Dict[Tuple[str, str], int]]:
+        """
+        Load both timestamp projections from the sidecar file, or from the manifest cache if it is stale.
+
+        Small manifest caches are parsed through the FileUtils JSON cache.
+        Files of at least MANIFEST_CACHE_STREAM_BYTES are streamed one plugin
+        at a time when ijson is installed, so the whole manifest is never
+        held in memory.
+
+        Returns:
+            Tuple of build timestamps and flat module timestamps
+
+        Raises:
+            FileProcessingError: If cache file cannot be read or parsed
+        """
+        stat = self.file_utils.stat_or_none(MANIFESTS_CACHE_FILE)
+        if stat is not None and self.file_utils.file_exists(TIMESTAMPS_FILE):
+            try:
+                sidecar = self.file_utils.load_json(TIMESTAMPS_FILE)
+            except FileProcessingError:
+                sidecar = {}
+            if (sidecar.get("manifest_mtime_ns") == stat.st_mtime_ns
+                    and sidecar.get("manifest_size") == stat.st_size
+                    and "module_timestamps" in sidecar):
+                build_timestamps = {intern(slug): timestamp for slug, timestamp in sidecar["build"].items()}
+                module_timestamps = {
+                    (intern(plugin_slug), intern(module_slug)): timestamp
+                    for plugin_slug, module_slug, timestamp in sidecar["module_timestamps"]
                 }
+                return build_timestamps, module_timestamps
+
+        if ijson is not None and stat is not None and stat.st_size >= MANIFEST_CACHE_STREAM_BYTES:
+            build_timestamps, module_timestamps = self._stream_all_timestamps()
+        else:
+            manifest_cache = self.file_utils.load_json(MANIFESTS_CACHE_FILE)
+            build_timestamps, module_timestamps = self._project_all_timestamps(manifest_cache.items())
+
+        if stat is not None:
+            sidecar = {
+                "manifest_mtime_ns": stat.st_mtime_ns,
+                "manifest_size": stat.st_size,
+                "build": build_timestamps,
+                # JSON has no tuple keys, so modules are stored as [plugin, module, timestamp]
+                "module_timestamps": [[*key, timestamp] for key, timestamp in module_timestamps.items()]
+            }
+            try:
+                self.file_utils.ensure_directory_exists(CACHE_DIR)
+                self.file_utils.save_json(sidecar, TIMESTAMPS_FILE)
+            except FileProcessingError:
+                # The sidecar only saves time on the next run
+                pass
 
-            return module_timestamps
+        return build_timestamps, module_timestamps
 
-        except FileNotFoundError as e:
-            log_error(f"Manifest cache file not found: {MANIFESTS_CACHE_FILE}", e, self.logger)
-            raise FileProcessingError(f"Manifest cache file not found: {MANIFESTS_CACHE_FILE}")
-        except json.JSONDecodeError as e:
-            log_error(f"Error decoding manifest cache file: {MANIFESTS_CACHE_FILE}", e, self.logger)
-            raise FileProcessingError(f"Error decoding manifest cache file: {MANIFESTS_CACHE_FILE}")
+    def _stream_all_timestamps(self) -> Tuple[Dict[str, int], Dict[Tuple[str, str], int]]:
+        """
+        Build both timestamp projections while streaming the manifest cache file with ijson.
+
+        Returns:
+            Tuple of build timestamps and flat module timestamps
 
-    def get_module_timestamp(self, plugin_slug: str, module_slug: str, module_timestamps: Dict[str, Dict[str, int]]) -> int:
+        Raises:
+            FileProcessingError: If cache file cannot be read or parsed
+        """
+        try:
+            with open(MANIFESTS_CACHE_FILE, "rb") as f:
+                return self._project_all_timestamps(ijson.kvitems(f, "", use_float=True))
+        except FileNotFoundError as e:
+            log_error(f"File not found: {MANIFESTS_CACHE_FILE}", e, self.logger)
+            raise FileProcessingError(f"File not found: {MANIFESTS_CACHE_FILE}")
+        except ijson.JSONError as e:
+            log_error(f"Error decoding JSON from {MANIFESTS_CACHE_FILE}", e, self.logger)
+            raise FileProcessingError(f"Error decoding JSON from {MANIFESTS_CACHE_FILE}")
+
+    @staticmethod
+    def _project_all_timestamps(plugins: PluginItems) -> Tuple[Dict[str, int], Dict[Tuple[str, str], int]]:
+        """Map plugin slugs to build timestamps and (plugin, module) pairs to creation timestamps."""
+        build_timestamps = {}
+        module_timestamps = {}
+        for plugin_slug, plugin_data in plugins:
+            # Interned slugs are shared by both maps and compare by identity on lookup
+            plugin_slug = intern(plugin_slug)
+            build_timestamps[plugin_slug] = plugin_data.get("buildTimestamp", -1)
+            # zip/map keep the per-module loop inside dict.update
+            modules = plugin_data.get("modules", {})
+            try:
+                module_timestamps.update(_module_timestamp_items(plugin_slug, modules, _get_creation_timestamp))
+            except KeyError:
+                # The field is almost always present, so only pay for .get() when it isn't
+                module_timestamps.update(_module_timestamp_items(plugin_slug, modules, _get_creation_timestamp_or_none))
+        return build_timestamps, module_timestamps
+
+    def get_module_timestamp(self, plugin_slug: str, module_slug: str, module_timestamps: Dict[Tuple[str, str], int]) -> int:
         """
         Get the creation timestamp for a specific module.
 
         Args:
             plugin_slug: Plugin identifier
             module_slug: Module identifier
-            module_timestamps: Nested dictionary of timestamps
+            module_timestamps: Flat dictionary of timestamps from get_flat_module_timestamps
 
         Returns:
             Creation timestamp for the module, or None if not found
         """
-        try:
-            return module_timestamps[plugin_slug][module_slug]
-        except KeyError:
+        timestamp = module_timestamps.get((plugin_slug, module_slug), _MISSING)
+        if timestamp is _MISSING:
             log_error(f"Missing timestamp for {plugin_slug}/{module_slug}", logger=self.logger)
-            return None
\ No newline at end of file
+            return None
+        return timestamp
+
+    def get_many_module_timestamps(
+        self,
+        pairs: List[Tuple[str, str]],
+        module_timestamps: Dict[Tuple[str, str], int]
+    ) -> List[Optional[int]]:
+        """
+        Get the creation timestamps for many modules at once.
+
+        Lookups run in a single map() over the flat dictionary instead of one
+        method call per module; missing modules are logged as in get_module_timestamp.
+
+        Args:
+            pairs: (plugin_slug, module_slug) pairs to look up
+            module_timestamps: Flat dictionary of timestamps from get_flat_module_timestamps
+
+        Returns:
+            Creation timestamps in the order of pairs, None where not found
+        """
+        timestamps = list(map(module_timestamps.get, pairs, repeat(_MISSING)))
+        if _MISSING in timestamps:
+            for i, timestamp in enumerate(timestamps):
+                if timestamp is _MISSING:
+                    plugin_slug, module_slug = pairs[i]
+                    log_error(f"Missing timestamp for {plugin_slug}/{module_slug}", logger=self.logger)
+                    timestamps[i] = None
+        return timestamps